@@ -5,12 +5,35 @@ AGK Language Compiler
 Main compiler that combines all components: lexer, parser, semantic analyzer, and code generator.
 """
 
+import hashlib
+import os
+import re
 import sys
+from collections import OrderedDict
 from typing import Optional
-from agk_lexer import AGKLexer
-from agk_parser import AGKParser
-from agk_semantic import SemanticAnalyzer
-from agk_codegen import CodeGenerator
+
+# Pipeline classes are imported lazily on the first compile() call so that
+# --help and an idle REPL don't pay the full toolchain import cost
+AGKLexer = None
+AGKParser = None
+SemanticAnalyzer = None
+CodeGenerator = None
+
+# Maximum number of compiled sources kept in the per-compiler cache
+_COMPILE_CACHE_SIZE = 128
+
+# REPL input that is already a definition or an assignment needs no wrapper
+_DEFINE_OR_ASSIGN = re.compile(r"^\s*(?:define\b|.*=)")
+
+
+def _load_pipeline():
+    """Import the compiler pipeline modules on first use"""
+    global AGKLexer, AGKParser, SemanticAnalyzer, CodeGenerator
+    if AGKLexer is None:
+        from agk_lexer import AGKLexer
+        from agk_parser import AGKParser
+        from agk_semantic import SemanticAnalyzer
+        from agk_codegen import CodeGenerator
 
 
 class AGKCompiler:
@@ -24,6 +47,8 @@ class AGKCompiler:
         self.generator = None
         self.errors = []
         self.warnings = []
+        self._compile_cache = OrderedDict()
+        self._generators = {}
 
     def compile(self, source_code: str, output_file: Optional[str] = None) -> bool:
         """
@@ -39,48 +64,29 @@ class AGKCompiler:
         self.errors = []
         self.warnings = []
 
+        # Repeat compiles of identical source (REPL re-runs, unchanged files)
+        # skip the whole pipeline and replay the cached result
+        cache_key = (hashlib.blake2b(source_code.encode(), digest_size=16).digest(),
+                     self.target_platform)
+        cached = self._compile_cache.get(cache_key)
         try:
-            # Phase 1: Lexical Analysis
-            print("Phase 1: Lexical Analysis...")
-            self.lexer = AGKLexer(source_code)
-            tokens = self.lexer.tokenize()
-
-            # Phase 2: Parsing
-            print("Phase 2: Parsing...")
-            self.parser = AGKParser(tokens)
-            ast = self.parser.parse()
-
-            # Phase 3: Semantic Analysis
-            print("Phase 3: Semantic Analysis...")
-            self.analyzer = SemanticAnalyzer()
-            semantic_success = self.analyzer.analyze(ast)
+            if cached is not None:
+                self._compile_cache.move_to_end(cache_key)
+                generated_code, cached_warnings = cached
+                self.warnings = list(cached_warnings)
+                print("Using cached compilation result...")
+                self._emit_result(generated_code, output_file)
+                return True
 
-            if not semantic_success:
-                self.errors.extend(self.analyzer.get_errors())
+            _load_pipeline()
 
-            self.warnings.extend(self.analyzer.get_warnings())
-
-            # Phase 4: Code Generation
-            print("Phase 4: Code Generation...")
-            print(f"Target platform: {self.target_platform}")
-            self.generator = CodeGenerator(self.target_platform)
-            generated_code = self.generator.generate(ast)
+            tokens = self._lex(source_code)
+            ast = self._parse(tokens)
+            self._analyze(ast)
+            generated_code = self._codegen(ast)
 
             # Output results
-            if output_file:
-                with open(output_file, 'w') as f:
-                    f.write(generated_code)
-                print(f"SUCCESS: Compilation successful! Output written to {output_file}")
-            else:
-                print("Generated Code:")
-                print("=" * 50)
-                print(generated_code)
-
-            # Report warnings
-            if self.warnings:
-                print(f"\nWarnings ({len(self.warnings)}):")
-                for warning in self.warnings:
-                    print(f"  WARNING: {warning}")
+            self._emit_result(generated_code, output_file)
 
             # Report errors (but don't fail if only warnings)
             if self.errors:
@@ -89,6 +95,11 @@ class AGKCompiler:
                     print(f"  ERROR: {error}")
                 return False
 
+            # Cache the successful result for repeat compiles
+            self._compile_cache[cache_key] = (generated_code, list(self.warnings))
+            if len(self._compile_cache) > _COMPILE_CACHE_SIZE:
+                self._compile_cache.popitem(last=False)
+
             return True
 
         except Exception as e:
@@ -96,6 +107,60 @@ class AGKCompiler:
             print(f"ERROR: Compilation failed: {e}")
             return False
 
+    def _lex(self, source_code: str):
+        """Phase 1: tokenize the source code"""
+        print("Phase 1: Lexical Analysis...")
+        self.lexer = AGKLexer(source_code)
+        return self.lexer.tokenize()
+
+    def _parse(self, tokens):
+        """Phase 2: build the AST from the token stream"""
+        print("Phase 2: Parsing...")
+        self.parser = AGKParser(tokens)
+        return self.parser.parse()
+
+    def _analyze(self, ast):
+        """Phase 3: semantic analysis; collects errors and warnings"""
+        print("Phase 3: Semantic Analysis...")
+        self.analyzer = SemanticAnalyzer()
+        if not self.analyzer.analyze(ast):
+            self.errors.extend(self.analyzer.get_errors())
+        self.warnings.extend(self.analyzer.get_warnings())
+
+    def _codegen(self, ast):
+        """Phase 4: generate code for the target platform"""
+        print("Phase 4: Code Generation...")
+        print(f"Target platform: {self.target_platform}")
+        if self.target_platform not in self._generators:
+            self._generators[self.target_platform] = CodeGenerator(self.target_platform)
+        self.generator = self._generators[self.target_platform]
+        return self.generator.generate(ast)
+
+    def _emit_result(self, generated_code: str, output_file: Optional[str]):
+        """Write or print generated code and report any warnings"""
+        if output_file:
+            # Single binary write: no per-chunk newline translation, normally
+            # one syscall (looping only if the OS reports a short write)
+            data = memoryview(generated_code.encode('utf-8'))
+            fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    written = os.write(fd, data)
+                    data = data[written:]
+            finally:
+                os.close(fd)
+            print(f"SUCCESS: Compilation successful! Output written to {output_file}")
+        else:
+            print("Generated Code:")
+            print("=" * 50)
+            print(generated_code)
+
+        # Report warnings
+        if self.warnings:
+            print(f"\nWarnings ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  WARNING: {warning}")
+
     def get_errors(self) -> list:
         """Get compilation errors"""
         return self.errors
@@ -187,7 +252,7 @@ def run_repl(target_platform: str = "python"):
                 continue
 
             # Add proper structure for single expressions
-            if not source.startswith('define') and '=' not in source:
+            if not _DEFINE_OR_ASSIGN.match(source):
                 source = f"define function temp: {source}"
 
             print("Compiling...")
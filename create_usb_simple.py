@@ -6,6 +6,7 @@ Creates a portable, bootable USB distribution of the AGK Mobile OS
 that can run from any USB drive without installation.
 """
 
+import io
 import os
 import sys
 import platform
@@ -15,6 +16,9 @@ from pathlib import Path
 import zipfile
 import tarfile
 
+# Buffer size for archive writes; a large buffer keeps syscall count low
+ARCHIVE_BUFFER_SIZE = 1 << 20
+
 class USBDistributionCreator:
     """Creates portable USB distributions of AGK Mobile OS"""
 
@@ -405,21 +409,36 @@ Run: pip install -r core/requirements.txt
         """Create compressed archives for distribution"""
         print("\n[INFO] Creating distribution archives...")
 
+        # Walk the distribution tree once and reuse the entries for both archives
+        dir_paths = []
+        file_paths = []
+        for root, dirs, files in os.walk(self.usb_root):
+            for name in dirs:
+                dir_paths.append(os.path.join(root, name))
+            for name in files:
+                file_paths.append(os.path.join(root, name))
+
         # Create ZIP archive
         zip_path = f"{self.dist_name}.zip"
+        base_dir = os.path.dirname(self.usb_root)
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(self.usb_root):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, os.path.dirname(self.usb_root))
-                    zipf.write(file_path, arcname)
+            for file_path in file_paths:
+                zipf.write(file_path, os.path.relpath(file_path, base_dir))
         print(f"   ZIP archive: {zip_path}")
 
         # Create TAR.GZ archive (Unix-like systems)
         if self.system != "windows":
             tar_path = f"{self.dist_name}.tar.gz"
-            with tarfile.open(tar_path, 'w:gz') as tarf:
-                tarf.add(self.usb_root, arcname=self.dist_name)
+            with open(tar_path, 'wb', buffering=0) as raw, \
+                 io.BufferedWriter(raw, buffer_size=ARCHIVE_BUFFER_SIZE) as buffered, \
+                 tarfile.open(fileobj=buffered, mode='w|gz') as tarf:
+                tarf.add(self.usb_root, arcname=self.dist_name, recursive=False)
+                for dir_path in dir_paths:
+                    rel = os.path.relpath(dir_path, self.usb_root)
+                    tarf.add(dir_path, arcname=f"{self.dist_name}/{rel}", recursive=False)
+                for file_path in file_paths:
+                    rel = os.path.relpath(file_path, self.usb_root)
+                    tarf.add(file_path, arcname=f"{self.dist_name}/{rel}")
             print(f"   TAR.GZ archive: {tar_path}")
 
         print("Distribution archives created")